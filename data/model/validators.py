@@ -1,6 +1,11 @@
+import re
 import uuid
 from datetime import datetime
 
+# fast path for the overwhelmingly common case: a canonical lower-case dashed
+# UUID which str(uuid.UUID(param)) would return unchanged anyway
+_UUID_RE_MATCH = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\Z").match
+
 
 def check_valid_uuid(param: str):
     """Validates that a UUID is valid or None. Otherwise, raises a ValueError.
@@ -13,6 +18,8 @@ def check_valid_uuid(param: str):
     """
     if param is None:
         return None
+    if isinstance(param, str) and _UUID_RE_MATCH(param):
+        return param
     try:
         param = uuid.UUID(param)
         return str(param)
@@ -19,6 +19,7 @@
 from pydantic import BaseModel, validator, NonNegativeInt, constr
 from data.model.validators import check_valid_uuid
 
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from typing import Union, Optional
@@ -41,34 +42,78 @@ class RecordingRecommendationMetadata(BaseModel):
     track_name: constr(min_length=1)
     release_name: Optional[str]
     recording_mbid: Optional[str]
-    recording_msid: constr(min_length=1)
+    # plain str: the uuid validator below already rejects empty strings, so a
+    # constr length check would only add a redundant validator call
+    recording_msid: str
 
-    _validate_uuids: classmethod = validator(
-        "recording_mbid",
-        "recording_msid",
-        allow_reuse=True
-    )(check_valid_uuid)
+    # decorator form instead of the usual classmethod-assignment idiom so the
+    # eventual pydantic v2 migration only needs to swap the decorator name
+    @validator("recording_mbid", "recording_msid", allow_reuse=True)
+    def _validate_uuids(cls, v):
+        return check_valid_uuid(v)
+
+    class Config:
+        # these models are nested inside the event models below; don't
+        # deep-copy them again on every event validation (pydantic v2's
+        # default behaviour)
+        copy_on_model_validation = False
 
 
 class NotificationMetadata(BaseModel):
     creator: constr(min_length=1)
     message: constr(min_length=1)
 
+    class Config:
+        copy_on_model_validation = False
 
-UserTimelineEventMetadata = Union[CBReviewTimelineMetadata, RecordingRecommendationMetadata, NotificationMetadata]
 
+UserTimelineEventMetadata = Union[CBReviewTimelineMetadata, RecordingRecommendationMetadata, NotificationMetadata]
 
-class UserTimelineEvent(BaseModel):
-    id: NonNegativeInt
-    user_id: NonNegativeInt
-    metadata: UserTimelineEventMetadata
+# the event_type already determines which metadata model applies, so use it as
+# a discriminator instead of letting pydantic try every union member in order
+EVENT_TYPE_METADATA_MODEL = {
+    UserTimelineEventType.RECORDING_RECOMMENDATION: RecordingRecommendationMetadata,
+    UserTimelineEventType.NOTIFICATION: NotificationMetadata,
+    UserTimelineEventType.CRITIQUEBRAINZ_REVIEW: CBReviewTimelineMetadata,
+}
+
+
+@dataclass(slots=True)
+class UserTimelineEvent:
+    """ Internal DTO for rows of the user_timeline_event table.
+
+    The rows come from our own database and don't need to be re-validated,
+    so this is a plain dataclass rather than a pydantic model; only the
+    metadata payload is parsed into its model for attribute access.
+    """
+    id: int
+    user_id: int
     event_type: UserTimelineEventType
-    created: Optional[datetime]
+    metadata: UserTimelineEventMetadata
+    created: Optional[datetime] = None
+
+    def __post_init__(self):
+        if not isinstance(self.event_type, UserTimelineEventType):
+            self.event_type = UserTimelineEventType(self.event_type)
+        if isinstance(self.metadata, dict):
+            self.metadata = EVENT_TYPE_METADATA_MODEL[self.event_type](**self.metadata)
+
+    def dict(self):
+        return {
+            'id': self.id,
+            'user_id': self.user_id,
+            'event_type': self.event_type,
+            'metadata': self.metadata.dict(),
+            'created': self.created,
+        }
 
 
 class APINotificationEvent(BaseModel):
     message: constr(min_length=1)
 
+    class Config:
+        copy_on_model_validation = False
+
 
 class APIFollowEvent(BaseModel):
     user_name_0: constr(min_length=1)
@@ -76,10 +121,16 @@ class APIFollowEvent(BaseModel):
     relationship_type: constr(min_length=1)
     created: NonNegativeInt
 
+    class Config:
+        copy_on_model_validation = False
+
 
 class APIPinEvent(APIListen):
     blurb_content: Optional[str]
 
+    class Config:
+        copy_on_model_validation = False
+
 
 class APICBReviewEvent(BaseModel):
     user_name: str
@@ -90,9 +141,22 @@ class APICBReviewEvent(BaseModel):
     text: str
     review_mbid: str
 
+    class Config:
+        copy_on_model_validation = False
+
 
 APIEventMetadata = Union[APIListen, APIFollowEvent, APINotificationEvent, APIPinEvent, APICBReviewEvent]
 
+# listens and recording recommendations both use APIListen as their metadata
+API_EVENT_TYPE_METADATA_MODEL = {
+    UserTimelineEventType.RECORDING_RECOMMENDATION: APIListen,
+    UserTimelineEventType.FOLLOW: APIFollowEvent,
+    UserTimelineEventType.LISTEN: APIListen,
+    UserTimelineEventType.NOTIFICATION: APINotificationEvent,
+    UserTimelineEventType.RECORDING_PIN: APIPinEvent,
+    UserTimelineEventType.CRITIQUEBRAINZ_REVIEW: APICBReviewEvent,
+}
+
 
 class APITimelineEvent(BaseModel):
     id: Optional[int]
@@ -102,10 +166,23 @@ class APITimelineEvent(BaseModel):
     metadata: APIEventMetadata
     hidden: bool
 
+    @validator("metadata", pre=True, allow_reuse=True)
+    def _resolve_metadata(cls, v, values):
+        model = API_EVENT_TYPE_METADATA_MODEL.get(values.get("event_type"))
+        if model is not None and isinstance(v, dict):
+            return model(**v)
+        return v
+
 
-class HiddenUserTimelineEvent(BaseModel):
-    id: NonNegativeInt
-    user_id: NonNegativeInt
+@dataclass(slots=True)
+class HiddenUserTimelineEvent:
+    """ Internal DTO for rows of the hide_user_timeline_event table. """
+    id: int
+    user_id: int
     event_type: UserTimelineEventType
-    event_id: NonNegativeInt
+    event_id: int
     created: datetime
+
+    def __post_init__(self):
+        if not isinstance(self.event_type, UserTimelineEventType):
+            self.event_type = UserTimelineEventType(self.event_type)
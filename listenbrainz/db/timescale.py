@@ -20,12 +20,18 @@ engine = None
 DUMP_DEFAULT_THREAD_COUNT = 4
 
 
-def init_db_connection(connect_str):
+def init_db_connection(connect_str, pool_size=None):
     """Initializes timescale connection using the specified Flask app.
 
     Configuration file must contain `SQLALCHEMY_DATABASE_URI` key. See
     https://pythonhosted.org/Flask-SQLAlchemy/config.html#configuration-keys
     for more info.
+
+    By default no connections are pooled (the webserver workers fork after
+    the engine has been created, so long-lived connections cannot be shared
+    safely there). Standalone single-process services may pass a pool_size
+    to keep that many long-lived connections around instead of opening a
+    new one for every engine.connect() call.
     """
     global engine
     if not connect_str:
@@ -33,7 +39,13 @@ def init_db_connection(connect_str):
 
     while True:
         try:
-            engine = create_engine(connect_str, poolclass=NullPool)
+            if pool_size:
+                # pre-ping checked-out connections so a timescale restart
+                # invalidates stale pooled connections transparently instead
+                # of failing one job per connection
+                engine = create_engine(connect_str, pool_size=pool_size, pool_pre_ping=True)
+            else:
+                engine = create_engine(connect_str, poolclass=NullPool)
             break
         except psycopg2.OperationalError as e:
             print("Couldn't establish connection to timescale: {}".format(str(e)))
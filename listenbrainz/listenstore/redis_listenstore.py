@@ -65,10 +65,13 @@ class RedisListenStore:
 
         # Don't take this very seriously -- if it fails, really no big deal. Let is go.
         if recent:
-            cache._r.zadd(cache._prep_key(self.RECENT_LISTENS_KEY), recent, nx=True)
+            # pipeline the add and the size check into one round trip
+            with cache._r.pipeline() as pipe:
+                pipe.zadd(cache._prep_key(self.RECENT_LISTENS_KEY), recent, nx=True)
+                pipe.zcard(cache._prep_key(self.RECENT_LISTENS_KEY))
+                count = pipe.execute()[1]
 
             # Don't prune the sorted list each time, but only when it reaches twice the desired size
-            count = cache._r.zcard(cache._prep_key(self.RECENT_LISTENS_KEY))
             if count > (self.RECENT_LISTENS_MAX * 2):
                 cache._r.zpopmin(cache._prep_key(self.RECENT_LISTENS_KEY), count - self.RECENT_LISTENS_MAX - 1)
 
@@ -86,9 +89,12 @@ class RedisListenStore:
         """ Increment the number of listens submitted on the day `day`
         by `count`.
         """
-        key = self.LISTEN_COUNT_PER_DAY_KEY + day.strftime('%Y%m%d')
-        cache.increment(key, amount=count)
-        cache.expire(key, self.LISTEN_COUNT_PER_DAY_EXPIRY_TIME)
+        key = cache._prep_key(self.LISTEN_COUNT_PER_DAY_KEY + day.strftime('%Y%m%d'))
+        # pipeline the increment and the expiry into one round trip
+        with cache._r.pipeline() as pipe:
+            pipe.incrby(key, count)
+            pipe.expire(key, self.LISTEN_COUNT_PER_DAY_EXPIRY_TIME)
+            pipe.execute()
 
     def get_listen_count_for_day(self, day: datetime) -> Optional[int]:
         """ Get the number of listens submitted for day `day`, return None if not available.
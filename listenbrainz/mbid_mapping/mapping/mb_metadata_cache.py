@@ -4,7 +4,7 @@ import uuid
 import psycopg2
 from psycopg2.errors import OperationalError
 import psycopg2.extras
-import ujson
+import orjson
 
 from mapping.utils import create_schema, insert_rows, log
 from mapping.formats import create_formats_table
@@ -143,10 +143,10 @@ class MusicBrainzMetadataCache(BulkInsertTable):
         return (row["recording_mbid"],
                 list(set(artist_mbids)),
                 row["release_mbid"],
-                ujson.dumps({"rels": recording_rels}),
-                ujson.dumps(artists),
-                ujson.dumps({"recording": recording_tags, "artist": artist_tags, "release_group": release_group_tags}),
-                ujson.dumps(release))
+                orjson.dumps({"rels": recording_rels}).decode("utf-8"),
+                orjson.dumps(artists).decode("utf-8"),
+                orjson.dumps({"recording": recording_tags, "artist": artist_tags, "release_group": release_group_tags}).decode("utf-8"),
+                orjson.dumps(release).decode("utf-8"))
 
     def get_metadata_cache_query(self, with_values=False):
         values_cte = ""
@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 import datetime
 from queue import PriorityQueue, Queue, Empty
 from typing import Any
-from time import monotonic, sleep
+from time import monotonic
 import threading
 import traceback
 from io import StringIO
@@ -41,6 +41,11 @@ NUM_ITEMS_TO_RECHECK_PER_PASS = 100000
 # When looking for mapped items marked for re-checking, use this batch size
 RECHECK_BATCH_SIZE = 5000
 
+# How many legacy/recheck listens to put into a single queued job. Each job
+# costs a round trip to the mapping tables, so batching amortises that cost
+# instead of paying it once per listen.
+LEGACY_LISTENS_BATCH_SIZE = 100
+
 
 @dataclass(order=True)
 class JobItem:
@@ -73,6 +78,11 @@ class MappingJobQueue(threading.Thread):
         init_cache(host=app.config['REDIS_HOST'], port=app.config['REDIS_PORT'],
                    namespace=app.config['REDIS_NAMESPACE'])
         metrics.init("listenbrainz")
+        # the mapping writer is a standalone single-process service, so it can
+        # use a small pool of long-lived timescale connections shared between
+        # the matcher threads instead of opening a new connection per job
+        timescale.init_db_connection(app.config['SQLALCHEMY_TIMESCALE_URI'],
+                                     pool_size=MAX_THREADS + 2)
         self.load_legacy_listens()
 
     def add_new_listens(self, listens):
@@ -130,6 +140,7 @@ class MappingJobQueue(threading.Thread):
         if len(msids) == 0:
             return 0
 
+        batch = []
         with msb_db.engine.connect() as connection:
             curs = connection.execute(sqlalchemy.text(msb_query), msids=tuple(msids))
             while True:
@@ -137,17 +148,21 @@ class MappingJobQueue(threading.Thread):
                 if not result:
                     break
 
-                self.queue.put(JobItem(priority, [
-                    {
-                        "track_metadata": {
-                            "artist_name": result[2],
-                            "track_name": result[1]
-                        },
-                        "recording_msid": result[0],
-                        "priority": priority
-                    }
-                ]))
+                batch.append({
+                    "track_metadata": {
+                        "artist_name": result[2],
+                        "track_name": result[1]
+                    },
+                    "recording_msid": result[0],
+                    "priority": priority
+                })
                 count += 1
+                if len(batch) >= LEGACY_LISTENS_BATCH_SIZE:
+                    self.queue.put(JobItem(priority, batch))
+                    batch = []
+
+        if batch:
+            self.queue.put(JobItem(priority, batch))
 
         return count
 
@@ -347,15 +362,18 @@ class MappingJobQueue(threading.Thread):
                         # Check to see if more legacy listens need to be loaded
                         for i in range(MAX_QUEUED_JOBS - len(uncompleted)):
                             try:
-                                job = self.queue.get(False)
+                                # block briefly instead of busy-waiting; new
+                                # jobs wake us up as soon as they arrive
+                                job = self.queue.get(timeout=.1)
                             except Empty:
-                                sleep(.1)
-                                continue
+                                break
 
                             futures[executor.submit(
                                 process_listens, self.app, job.item, job.priority)] = job.priority
                             if job.priority == LEGACY_LISTEN:
-                                stats["legacy"] += 1
+                                # jobs carry batches of listens, so count the
+                                # listens, not the jobs
+                                stats["legacy"] += len(job.item)
 
                         if self.legacy_load_thread and not self.legacy_load_thread.is_alive():
                             self.legacy_load_thread = None
@@ -1,5 +1,6 @@
 #!/usr/bin/python3
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List
 
 import spotipy
@@ -22,6 +23,7 @@ from listenbrainz.webserver.views.api_tools import insert_payload, validate_list
     LISTEN_TYPE_PLAYING_NOW
 
 METRIC_UPDATE_INTERVAL = 60  # seconds
+MAX_THREADS = 4  # number of users to import concurrently; each import is mostly waiting on the Spotify API
 _listens_imported_since_last_update = 0  # number of listens imported since last metric update was submitted
 _metric_submission_time = time.monotonic() + METRIC_UPDATE_INTERVAL
 
@@ -376,21 +378,32 @@ def process_all_spotify_users():
         return 0, 0
 
     current_app.logger.info('Process %d users...' % len(users))
+
+    app = current_app._get_current_object()
+
+    def import_with_app_context(u):
+        # worker threads need their own app context for current_app and co.
+        with app.app_context():
+            return process_one_user(u, service)
+
     success = 0
     failure = 0
-    for u in users:
-        try:
-            _listens_imported_since_last_update += process_one_user(u, service)
-            success += 1
-        except Exception:
-            current_app.logger.critical('spotify_reader could not import listens for user %s:',
-                                        u['musicbrainz_id'], exc_info=True)
-            failure += 1
-
-        if time.monotonic() > _metric_submission_time:
-            _metric_submission_time += METRIC_UPDATE_INTERVAL
-            metrics.set("spotify_reader", imported_listens=_listens_imported_since_last_update)
-            _listens_imported_since_last_update = 0
+    with ThreadPoolExecutor(max_workers=MAX_THREADS) as executor:
+        futures = {executor.submit(import_with_app_context, u): u for u in users}
+        for future in as_completed(futures):
+            u = futures[future]
+            try:
+                _listens_imported_since_last_update += future.result()
+                success += 1
+            except Exception:
+                current_app.logger.critical('spotify_reader could not import listens for user %s:',
+                                            u['musicbrainz_id'], exc_info=True)
+                failure += 1
+
+            if time.monotonic() > _metric_submission_time:
+                _metric_submission_time += METRIC_UPDATE_INTERVAL
+                metrics.set("spotify_reader", imported_listens=_listens_imported_since_last_update)
+                _listens_imported_since_last_update = 0
 
     current_app.logger.info('Processed %d users successfully!', success)
     current_app.logger.info('Encountered errors while processing %d users.', failure)
@@ -36,28 +36,33 @@ def get_artists(table: str, number_of_results: int) -> Iterator[ArtistRecord]:
           GROUP BY user_id
                  , lower(artist_name)
                  , artist_credit_mbids
-        ), ranked_stats as (
+        ), entity_table as (
             SELECT user_id
                  , any_artist_name AS artist_name
                  , artist_credit_mbids
                  , listen_count
-                 , row_number() OVER (PARTITION BY user_id ORDER BY listen_count DESC) AS rank
               FROM intermediate_table
         )
+        -- slicing the sorted list keeps the same entries as the old
+        -- "rank < number_of_results" row_number filter, without paying for
+        -- a separate sort + window stage before the final aggregation
         SELECT user_id
-             , sort_array(
-                    collect_list(
-                        struct(
-                            listen_count
-                          , artist_name
-                          , coalesce(artist_credit_mbids, array()) AS artist_mbids
+             , slice(
+                    sort_array(
+                        collect_list(
+                            struct(
+                                listen_count
+                              , artist_name
+                              , coalesce(artist_credit_mbids, array()) AS artist_mbids
+                            )
                         )
+                        , false
                     )
-                    , false
+                   , 1
+                   , {number_of_results - 1}
                ) as artists
-          FROM ranked_stats
-         WHERE rank < {number_of_results}
-      GROUP BY user_id 
+          FROM entity_table
+      GROUP BY user_id
     """)
 
     return result.toLocalIterator()
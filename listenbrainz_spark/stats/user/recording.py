@@ -11,7 +11,7 @@ def get_recordings(table: str, number_of_results: int):
         number_of_results: number of top results to keep per user.
 
     Returns:
-        iterator (iter): an iterator over result:
+        list: a list of rows:
                 {
                     'user1' : [
                         {
@@ -45,7 +45,7 @@ def get_recordings(table: str, number_of_results: int):
                  , artist_credit_mbids
                  , lower(release_name)
                  , release_mbid
-        ), ranked_stats as (
+        ), entity_table as (
             SELECT user_id
                  , any_recording_name AS track_name
                  , recording_mbid
@@ -54,27 +54,34 @@ def get_recordings(table: str, number_of_results: int):
                  , any_artist_name AS artist_name
                  , artist_credit_mbids
                  , listen_count
-                 , row_number() OVER (PARTITION BY user_id ORDER BY listen_count DESC) AS rank
               FROM intermediate_table
         )
+        -- slicing the sorted list keeps the same entries as the old
+        -- "rank < number_of_results" row_number filter, without paying for
+        -- a separate sort + window stage before the final aggregation
         SELECT user_id
-             , sort_array(
-                    collect_list(
-                        struct(
-                            listen_count
-                          , track_name
-                          , recording_mbid
-                          , artist_name
-                          , coalesce(artist_credit_mbids, array()) AS artist_mbids
-                          , release_name
-                          , release_mbid
+             , slice(
+                    sort_array(
+                        collect_list(
+                            struct(
+                                listen_count
+                              , track_name
+                              , recording_mbid
+                              , artist_name
+                              , coalesce(artist_credit_mbids, array()) AS artist_mbids
+                              , release_name
+                              , release_mbid
+                            )
                         )
+                       , false
                     )
-                   , false
-                ) as recordings
-          FROM ranked_stats
-         WHERE rank < {number_of_results}
+                   , 1
+                   , {number_of_results - 1}
+               ) as recordings
+          FROM entity_table
       GROUP BY user_id
         """)
 
-    return result.toLocalIterator()
+    # collect() fetches the result in one job; toLocalIterator() would run a
+    # separate job (re-executing the upstream stages) for every partition
+    return result.collect()